@@ -9,7 +9,15 @@ import sys
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from transforms import normalize_address
+import transforms
+from transforms import (
+    normalize_address,
+    normalize_address_series,
+    normalize_email,
+    normalize_email_series,
+    normalize_phone,
+    normalize_phone_series,
+)
 
 @pytest.fixture
 def input_csv_path():
@@ -23,6 +31,35 @@ def input_df(input_csv_path):
     return pd.read_csv(input_csv_path)
 
 
+@pytest.fixture
+def dirty_csv_path(tmp_path):
+    """Fixture writing a CSV with punctuation-heavy, messy values."""
+    df = pd.DataFrame({
+        'contact_id': [1, 2, 3, 4, 5, 6],
+        'email': ['  UPPER.CASE@EXAMPLE.COM  ', 'not-an-email', '',
+                  'ok@example.org', None, 'MiXeD@CaSe.NeT'],
+        'phone_number': ['(555) 000-1111', '1-555-000-2222', '555-00',
+                         None, '555 000 3333', 'no digits here'],
+        'address': ['123 Main St. Apt 4', '45 Oak-St', "789 O'BRIEN Ln",
+                    '  987 cedar AVE  ', None, '1 ELM WAY'],
+    })
+    path = tmp_path / 'dirty.csv'
+    df.to_csv(path, index=False)
+    return path
+
+
+def assert_matches_pandas_kernels(result, source_df):
+    """Assert a transformed frame matches the pandas series kernels."""
+    expected = {
+        'email': normalize_email_series(source_df['email']),
+        'phone_number': normalize_phone_series(source_df['phone_number']),
+        'address': normalize_address_series(source_df['address']),
+    }
+    for col, want_col in expected.items():
+        for got, want in zip(result[col], want_col):
+            assert (pd.isna(got) and pd.isna(want)) or got == want, col
+
+
 def test_normalize_address_standardization(input_df):
     """Test address normalization standardizes abbreviations."""
     address = input_df.loc[0, 'address']
@@ -34,6 +71,188 @@ def test_normalize_address_ave_abbreviation(input_df):
     """Test address normalization handles 'Ave' abbreviation."""
     address = input_df.loc[1, 'address']
     normalized = normalize_address(address)
-    assert normalized == '456 Oak Avenue '
+    assert normalized == '456 Oak Avenue'
+
+
+def test_normalize_address_all_abbreviations():
+    """Test address normalization expands every supported abbreviation."""
+    assert normalize_address('1 A st') == '1 A Street'
+    assert normalize_address('1 A rd') == '1 A Road'
+    assert normalize_address('1 A DR') == '1 A Drive'
+    assert normalize_address('1 A Ln') == '1 A Lane'
+    assert normalize_address('1 A way') == '1 A Way'
+
+
+def test_normalize_address_token_boundaries():
+    """Test abbreviations only expand as standalone whitespace tokens."""
+    assert normalize_address('123 Main St. Apt 4') == '123 Main St. Apt 4'
+    assert normalize_address('45 Oak-St') == '45 Oak-st'
+    assert normalize_address("789 O'BRIEN Ln") == "789 O'brien Lane"
+    assert normalize_address('  987 cedar ln  ') == '987 Cedar Lane'
+    assert normalize_address('   ') is None
+    assert normalize_address('') is None
+
+
+def test_normalize_address_series_matches_scalar(input_df):
+    """Test deduplicated address normalization agrees with the scalar function."""
+    duplicated = pd.concat([input_df['address']] * 3, ignore_index=True)
+    result = normalize_address_series(duplicated)
+    expected = duplicated.apply(normalize_address)
+    assert list(result) == list(expected)
+
+
+def test_map_unique_handles_na_and_duplicates():
+    """Test the factorize-based dedup maps NA rows and repeats correctly."""
+    s = pd.Series(['a', None, 'a', 'b', None])
+    calls = []
+
+    def record(value):
+        calls.append(value)
+        return value.upper()
+
+    result = transforms._map_unique(s, record)
+    assert list(result) == ['A', None, 'A', 'B', None]
+    assert calls == ['a', 'b']
+
+
+def test_generated_transform_matches_kernels(input_df):
+    """Test the generated column transform matches the kernels it inlines."""
+    result = transforms._transform_columns(input_df.copy())
+    for col, want in [('email', normalize_email_series(input_df['email'])),
+                      ('phone_number', normalize_phone_series(input_df['phone_number'])),
+                      ('address', normalize_address_series(input_df['address']))]:
+        for got, expected in zip(result[col], want):
+            assert (pd.isna(got) and pd.isna(expected)) or got == expected
+
+
+def test_normalize_email_strips_and_lowercases(input_df):
+    """Test email normalization strips whitespace and lowercases."""
+    email = input_df.loc[0, 'email']
+    normalized = normalize_email(email)
+    assert normalized == 'john.smith@example.com'
+
+
+def test_normalize_email_missing():
+    """Test email normalization returns None for missing/invalid values."""
+    assert normalize_email(None) is None
+    assert normalize_email('') is None
+    assert normalize_email('not-an-email') is None
+
+
+def test_normalize_phone_ten_digits(input_df):
+    """Test phone normalization formats 10-digit numbers."""
+    phone = input_df.loc[0, 'phone_number']
+    normalized = normalize_phone(phone)
+    assert normalized == '(555) 123-4567'
+
+
+def test_normalize_phone_country_code(input_df):
+    """Test phone normalization keeps the leading '1' country code."""
+    phone = input_df.loc[2, 'phone_number']
+    normalized = normalize_phone(phone)
+    assert normalized == '1-555-123-4569'
+
+
+def test_normalize_phone_invalid_length(input_df):
+    """Test phone normalization returns None for invalid lengths."""
+    phone = input_df.loc[5, 'phone_number']
+    assert normalize_phone(phone) is None
+    assert normalize_phone(None) is None
+
+
+def test_normalize_phone_series_matches_scalar(input_df):
+    """Test vectorized phone normalization agrees with the scalar function."""
+    result = normalize_phone_series(input_df['phone_number'])
+    expected = input_df['phone_number'].apply(normalize_phone)
+    for got, want in zip(result, expected):
+        assert (pd.isna(got) and pd.isna(want)) or got == want
+
+
+@pytest.mark.skipif(not (transforms._HAS_NUMBA and transforms._HAS_PYARROW),
+                    reason='numba or pyarrow not installed')
+def test_normalize_phones_numba_matches_scalar(input_df):
+    """Test the jitted phone pipeline agrees with the scalar function."""
+    s = pd.concat([input_df['phone_number'], pd.Series([None])], ignore_index=True)
+    result = transforms._normalize_phones_numba(s)
+    expected = s.apply(normalize_phone)
+    for got, want in zip(result, expected):
+        assert (pd.isna(got) and pd.isna(want)) or got == want
+
+
+@pytest.mark.skipif(not transforms._HAS_PYARROW, reason='pyarrow not installed')
+def test_arrow_pipeline_matches_pandas(input_csv_path, dirty_csv_path):
+    """Test the Arrow transform path agrees with the pandas kernels."""
+    for path in (input_csv_path, dirty_csv_path):
+        arrow_df = transforms._transform_contacts_arrow(str(path))
+        assert_matches_pandas_kernels(arrow_df, pd.read_csv(path))
+
+
+@pytest.mark.skipif(not transforms._HAS_POLARS, reason='polars not installed')
+def test_polars_pipeline_matches_pandas(input_csv_path, dirty_csv_path, tmp_path):
+    """Test the streamed polars CSV path agrees with the pandas kernels."""
+    for i, path in enumerate((input_csv_path, dirty_csv_path)):
+        out_path = tmp_path / f'cleaned_{i}.csv'
+        transforms._transform_contacts_polars(str(path), str(out_path))
+        assert_matches_pandas_kernels(pd.read_csv(out_path), pd.read_csv(path))
+
+
+def test_transform_contacts_csv_returns_none(input_csv_path, tmp_path):
+    """Test the CSV path's return value does not depend on accelerators."""
+    assert transforms.transform_contacts(str(input_csv_path),
+                                         str(tmp_path / 'out.csv'),
+                                         output_format='csv') is None
+
+
+def test_transform_contacts_excel_roundtrip(input_csv_path, tmp_path):
+    """Test the end-to-end Excel pipeline writes a readable workbook."""
+    out_path = tmp_path / 'cleaned.xlsx'
+    transforms.transform_contacts(str(input_csv_path), str(out_path))
+    result = pd.read_excel(out_path)
+    assert result.loc[0, 'email'] == 'john.smith@example.com'
+    assert result.loc[0, 'phone_number'] == '(555) 123-4567'
+    assert result.loc[0, 'address'] == '123 Main Street'
+
+
+def test_transform_contacts_chunked_matches_full(input_csv_path, tmp_path):
+    """Test chunked streaming produces the same CSV as the one-shot path."""
+    full_path = tmp_path / 'full.csv'
+    chunked_path = tmp_path / 'chunked.csv'
+    transforms._transform_contacts_chunked(str(input_csv_path), str(full_path),
+                                           'csv', chunksize=1000)
+    transforms._transform_contacts_chunked(str(input_csv_path), str(chunked_path),
+                                           'csv', chunksize=3)
+    assert full_path.read_text() == chunked_path.read_text()
+
+
+@pytest.mark.skipif(not transforms._HAS_PYARROW, reason='pyarrow not installed')
+def test_utf8_lower_matches_arrow_kernel():
+    """Test the ASCII fast path and the non-ASCII fallback both lowercase."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    ascii_arr = pa.array(['JOHN@EXAMPLE.COM', None, 'MiXeD@Case.Org'])
+    assert transforms._utf8_lower(ascii_arr).equals(pc.utf8_lower(ascii_arr))
+    unicode_arr = pa.array(['ÜBER@EXAMPLE.COM', 'PLAIN@EXAMPLE.COM'])
+    assert transforms._utf8_lower(unicode_arr).equals(pc.utf8_lower(unicode_arr))
+
+
+@pytest.mark.skipif(not (transforms._HAS_NUMBA and transforms._HAS_PYARROW),
+                    reason='numba or pyarrow not installed')
+def test_normalize_emails_numba_matches_series(input_df):
+    """Test the fused email kernel agrees with the multi-pass kernels."""
+    s = input_df['email']
+    result = transforms._normalize_emails_numba(s)
+    expected = normalize_email_series(s)
+    for got, want in zip(result, expected):
+        assert (pd.isna(got) and pd.isna(want)) or got == want
+    unicode_col = pd.Series(['ÜBER@EXAMPLE.COM'])
+    assert transforms._normalize_emails_numba(unicode_col) is None
+
+
+def test_normalize_email_series_matches_scalar(input_df):
+    """Test vectorized email normalization agrees with the scalar function."""
+    result = normalize_email_series(input_df['email'])
+    expected = input_df['email'].apply(normalize_email)
+    for got, want in zip(result, expected):
+        assert (pd.isna(got) and pd.isna(want)) or got == want
 
 